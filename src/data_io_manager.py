@@ -1,10 +1,441 @@
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.feather as pf
+import pyarrow.json as paj
+import pyarrow.parquet as pq
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, List
+import io
 import json
 import os
-import datetime
+import re
+import time
 from src.db_connections import PostgreSQLDB
-from sqlalchemy import text
+from psycopg2 import sql
+
+_TIMESTAMP_FORMAT = "%d-%m-%Y_%H-%M-%S"
+_timestamp_cache = (None, "")
+
+def _current_timestamp() -> str:
+    """
+    Returns the current local time formatted for file names, formatting at most once per second.
+
+    Returns:
+        str: The formatted timestamp.
+    """
+    global _timestamp_cache
+    now = int(time.time())
+    if _timestamp_cache[0] != now:
+        _timestamp_cache = (now, time.strftime(_TIMESTAMP_FORMAT, time.localtime(now)))
+    return _timestamp_cache[1]
+
+def _arrow_table_to_pandas(table: pa.Table) -> pd.DataFrame:
+    """
+    Converts a PyArrow Table to a DataFrame backed by Arrow dtypes.
+
+    Args:
+        table (pa.Table): The table to convert.
+
+    Returns:
+        pd.DataFrame: The DataFrame sharing the table's Arrow buffers.
+    """
+    return table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True, split_blocks=True)
+
+_CSV_READ_OPTIONS = pv.ReadOptions(use_threads=True, block_size=64 << 20)
+_JSON_READ_OPTIONS = paj.ReadOptions(use_threads=True, block_size=32 << 20)
+
+def _is_column_oriented_json(path: str) -> bool:
+    """
+    Checks whether a JSON file is a single document rather than JSON Lines.
+
+    This covers the column-oriented output of DataFrame.to_json (one line whose values are all
+    objects) and documents that do not fit on their first line.
+
+    Args:
+        path (str): The path of the file to inspect.
+
+    Returns:
+        bool: True if the file should be parsed as one JSON document.
+    """
+    with open(path, 'rb') as f:
+        first_line = f.readline()
+        is_single_line = not f.read().strip()
+    try:
+        record = json.loads(first_line)
+    except ValueError:
+        return True
+    if not isinstance(record, dict):
+        return True
+    return is_single_line and bool(record) and all(isinstance(value, dict) for value in record.values())
+
+def _read_json(path: str, columns: List[str] = None) -> pd.DataFrame:
+    """
+    Reads a JSON file.
+
+    JSON Lines files go through PyArrow's multithreaded reader; single JSON documents, such as the
+    column-oriented output of DataFrame.to_json, are parsed by Pandas.
+
+    Args:
+        path (str): The path of the file to read.
+        columns (List[str]): The columns to keep. Defaults to all columns.
+
+    Returns:
+        pd.DataFrame: The DataFrame containing the read data.
+    """
+    if _is_column_oriented_json(path):
+        df = pd.read_json(path, dtype_backend='pyarrow')
+        return df if columns is None else df[columns]
+
+    table = paj.read_json(path, read_options=_JSON_READ_OPTIONS)
+    if columns is not None:
+        table = table.select(columns)
+    return _arrow_table_to_pandas(table)
+
+def _csv_convert_options(columns: List[str] = None) -> pv.ConvertOptions:
+    """
+    Builds the CSV conversion options shared by the whole-file and batched readers.
+
+    Args:
+        columns (List[str]): The columns to convert. Defaults to all columns.
+
+    Returns:
+        pv.ConvertOptions: The conversion options, treating empty strings as null like pd.read_csv.
+    """
+    return pv.ConvertOptions(include_columns=columns or [], strings_can_be_null=True)
+
+def _read_csv(path: str, columns: List[str] = None) -> pd.DataFrame:
+    """
+    Reads a CSV file with PyArrow's multithreaded reader.
+
+    Args:
+        path (str): The path of the file to read.
+        columns (List[str]): The columns to convert. Defaults to all columns.
+
+    Returns:
+        pd.DataFrame: The DataFrame containing the read data.
+    """
+    table = pv.read_csv(path, read_options=_CSV_READ_OPTIONS, convert_options=_csv_convert_options(columns))
+    return _arrow_table_to_pandas(table)
+
+def _read_parquet(path: str, columns: List[str] = None) -> pd.DataFrame:
+    """
+    Reads a memory-mapped Parquet file.
+
+    Args:
+        path (str): The path of the file to read.
+        columns (List[str]): The columns to read. Defaults to all columns.
+
+    Returns:
+        pd.DataFrame: The DataFrame containing the read data.
+    """
+    return _arrow_table_to_pandas(pq.read_table(path, columns=columns, memory_map=True, use_threads=True))
+
+def _read_feather(path: str, columns: List[str] = None) -> pd.DataFrame:
+    """
+    Reads a memory-mapped Feather file.
+
+    Args:
+        path (str): The path of the file to read.
+        columns (List[str]): The columns to read. Defaults to all columns.
+
+    Returns:
+        pd.DataFrame: The DataFrame containing the read data.
+    """
+    return _arrow_table_to_pandas(pf.read_table(path, columns=columns, memory_map=True, use_threads=True))
+
+def _slice_batches(batches: Iterable[pa.RecordBatch], batch_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Re-slices Arrow record batches to at most batch_size rows and converts them to DataFrames.
+
+    Args:
+        batches (Iterable[pa.RecordBatch]): The record batches produced by a reader.
+        batch_size (int): The maximum number of rows per batch.
+
+    Yields:
+        pd.DataFrame: A DataFrame backed by Arrow dtypes.
+    """
+    for batch in batches:
+        for start in range(0, batch.num_rows, batch_size):
+            yield _arrow_table_to_pandas(pa.Table.from_batches([batch.slice(start, batch_size)]))
+
+def _iter_read_json(path: str, batch_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Reads a JSON Lines file in batches with PyArrow's streaming reader.
+
+    Args:
+        path (str): The path of the file to read.
+        batch_size (int): The maximum number of rows per batch.
+
+    Yields:
+        pd.DataFrame: A DataFrame containing the next batch of rows.
+    """
+    yield from _slice_batches(paj.open_json(path, read_options=_JSON_READ_OPTIONS), batch_size)
+
+def _iter_read_csv(path: str, batch_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Reads a CSV file in batches with PyArrow's streaming reader.
+
+    Args:
+        path (str): The path of the file to read.
+        batch_size (int): The maximum number of rows per batch.
+
+    Yields:
+        pd.DataFrame: A DataFrame containing the next batch of rows.
+    """
+    reader = pv.open_csv(path, read_options=_CSV_READ_OPTIONS, convert_options=_csv_convert_options())
+    yield from _slice_batches(reader, batch_size)
+
+def _iter_read_parquet(path: str, batch_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Reads a memory-mapped Parquet file in batches.
+
+    Args:
+        path (str): The path of the file to read.
+        batch_size (int): The maximum number of rows per batch.
+
+    Yields:
+        pd.DataFrame: A DataFrame containing the next batch of rows.
+    """
+    for batch in pq.ParquetFile(path, memory_map=True).iter_batches(batch_size=batch_size):
+        yield _arrow_table_to_pandas(pa.Table.from_batches([batch]))
+
+def _iter_read_feather(path: str, batch_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Reads a memory-mapped Feather file in batches.
+
+    Args:
+        path (str): The path of the file to read.
+        batch_size (int): The maximum number of rows per batch.
+
+    Yields:
+        pd.DataFrame: A DataFrame containing the next batch of rows.
+    """
+    with pa.memory_map(path) as source:
+        reader = pa.ipc.open_file(source)
+        yield from _slice_batches((reader.get_batch(index) for index in range(reader.num_record_batches)), batch_size)
+
+_PARQUET_ROW_GROUP_SIZE = 128 << 10
+_PARQUET_COMPRESSION_LEVEL = 3
+_PARQUET_SCHEMA_LOOKAHEAD = 8
+_LOW_CARDINALITY_RATIO = 0.1
+_HIGH_ENTROPY_RATIO = 0.9
+# Well under pyarrow's 1 MB dictionary_pagesize_limit, so later batches can still add values.
+_MAX_DICTIONARY_VALUES = 4096
+_MAX_DICTIONARY_BYTES = 256 << 10
+
+def _estimate_dictionary_bytes(values: pd.Series) -> int:
+    """
+    Estimates the size of a Parquet dictionary page holding the given distinct values.
+
+    Args:
+        values (pd.Series): The distinct non-null values of a column.
+
+    Returns:
+        int: The estimated dictionary size in bytes.
+    """
+    itemsize = getattr(values.dtype, 'itemsize', None)
+    if values.dtype.kind in 'biufcmM' and itemsize:
+        return len(values) * itemsize
+    # Variable-length values are stored with a 4-byte length prefix.
+    return sum(len(str(value).encode()) + 4 for value in values)
+
+def _should_compress(series: pd.Series) -> bool:
+    """
+    Decides whether compressing a column chunk is likely to pay off.
+
+    Low-cardinality columns are already compact once dictionary-encoded, as long as the dictionary
+    stays small enough that pyarrow does not fall back to plain encoding. Floats that are almost all
+    distinct barely compress. Both are left uncompressed to save decode time.
+
+    Args:
+        series (pd.Series): A sample of the column to inspect.
+
+    Returns:
+        bool: True if the column should be compressed.
+    """
+    if series.empty:
+        return True
+    try:
+        distinct = series.dropna().unique()
+    except TypeError:
+        return True
+    distinct_ratio = len(distinct) / len(series)
+    if (
+        distinct_ratio < _LOW_CARDINALITY_RATIO
+        and len(distinct) <= _MAX_DICTIONARY_VALUES
+        and _estimate_dictionary_bytes(pd.Series(distinct, dtype=series.dtype)) <= _MAX_DICTIONARY_BYTES
+    ):
+        return False
+    if series.dtype.kind == 'f' and distinct_ratio > _HIGH_ENTROPY_RATIO:
+        return False
+    return True
+
+def _cast_to_schema(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """
+    Casts a batch to the schema of a Parquet file that is already being written.
+
+    Args:
+        table (pa.Table): The batch to cast.
+        schema (pa.Schema): The schema of the file.
+
+    Returns:
+        pa.Table: The batch with the file's schema.
+
+    Raises:
+        ValueError: If the batch's columns differ or a column cannot be cast.
+    """
+    if table.schema.equals(schema):
+        return table
+    if table.schema.names != schema.names:
+        raise ValueError(f"Batch columns {table.schema.names} do not match the file columns {schema.names}")
+
+    columns = []
+    for field, column in zip(schema, table.columns):
+        try:
+            columns.append(column.cast(field.type))
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+            raise ValueError(
+                f"Column '{field.name}' has type {column.type} in a later batch, "
+                f"which cannot be cast to the file type {field.type}: {e}"
+            )
+    return pa.Table.from_arrays(columns, schema=schema)
+
+def _write_parquet(batches: Iterable[pd.DataFrame], path: str) -> bool:
+    """
+    Writes DataFrame batches to a single Parquet file, one row group at a time.
+
+    The file schema is taken from the first batches: while a column is still all-null, up to
+    _PARQUET_SCHEMA_LOOKAHEAD batches are buffered and their schemas unified. Columns that are
+    still all-null after that stay null-typed. Per-column compression is decided once from the
+    first batch.
+
+    Args:
+        batches (Iterable[pd.DataFrame]): The DataFrames to write, sharing the same columns.
+        path (str): The path of the file to write.
+
+    Returns:
+        bool: True if a file was written, False if there were no batches.
+    """
+    writer = None
+    schema = None
+    first_batch = None
+    pending = []
+    try:
+        for batch in batches:
+            if first_batch is None:
+                first_batch = batch
+            pending.append(pa.Table.from_pandas(batch, preserve_index=False))
+            if writer is None:
+                schema = pa.unify_schemas([table.schema for table in pending], promote_options='permissive')
+                has_null_columns = any(pa.types.is_null(field.type) for field in schema)
+                if has_null_columns and len(pending) < _PARQUET_SCHEMA_LOOKAHEAD:
+                    continue
+                writer = _open_parquet_writer(path, schema, first_batch)
+            for table in pending:
+                writer.write_table(_cast_to_schema(table, schema), row_group_size=_PARQUET_ROW_GROUP_SIZE)
+            pending = []
+
+        if pending:
+            # The stream ended within the lookahead while a column was still all-null.
+            writer = _open_parquet_writer(path, schema, first_batch)
+            for table in pending:
+                writer.write_table(_cast_to_schema(table, schema), row_group_size=_PARQUET_ROW_GROUP_SIZE)
+    finally:
+        if writer is not None:
+            writer.close()
+    return writer is not None
+
+def _open_parquet_writer(path: str, schema: pa.Schema, sample: pd.DataFrame) -> pq.ParquetWriter:
+    """
+    Opens a Parquet writer choosing per-column compression from a sample batch.
+
+    Args:
+        path (str): The path of the file to write.
+        schema (pa.Schema): The file schema.
+        sample (pd.DataFrame): The batch used to decide which columns to compress.
+
+    Returns:
+        pq.ParquetWriter: The open writer.
+    """
+    compressed = {name: _should_compress(sample[column]) for name, column in zip(schema.names, sample.columns)}
+    return pq.ParquetWriter(
+        path,
+        schema,
+        compression={name: 'zstd' if compress else 'none' for name, compress in compressed.items()},
+        compression_level={name: _PARQUET_COMPRESSION_LEVEL for name, compress in compressed.items() if compress},
+        use_dictionary=True,
+        data_page_version='2.0',
+        write_statistics=True
+    )
+
+def _write_json(df: pd.DataFrame, path: str) -> None:
+    """
+    Writes a DataFrame as JSON Lines.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to write.
+        path (str): The path of the file to write.
+
+    Returns:
+        None
+    """
+    df.to_json(path, orient='records', lines=True, date_format='iso')
+
+def _write_csv(df: pd.DataFrame, path: str) -> None:
+    """
+    Writes a DataFrame as CSV.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to write.
+        path (str): The path of the file to write.
+
+    Returns:
+        None
+    """
+    df.to_csv(path, index=False)
+
+def _write_parquet_frame(df: pd.DataFrame, path: str) -> None:
+    """
+    Writes a DataFrame as Parquet, one row group at a time.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to write.
+        path (str): The path of the file to write.
+
+    Returns:
+        None
+    """
+    _write_parquet(
+        (df.iloc[start:start + _PARQUET_ROW_GROUP_SIZE] for start in range(0, max(len(df), 1), _PARQUET_ROW_GROUP_SIZE)),
+        path
+    )
+
+def _write_feather(df: pd.DataFrame, path: str) -> None:
+    """
+    Writes a DataFrame as Zstd-compressed Feather.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to write.
+        path (str): The path of the file to write.
+
+    Returns:
+        None
+    """
+    df.to_feather(path, compression='zstd')
+
+def _file_extension(path: str) -> str:
+    """
+    Extracts the extension of a file path.
+
+    Args:
+        path (str): The file path.
+
+    Returns:
+        str: The lower-cased extension, without the leading dot.
+    """
+    return os.path.splitext(path)[1][1:].lower()
 
 class BaseDataHandler(ABC):
 
@@ -21,35 +452,101 @@ class BaseDataHandler(ABC):
 class LocalDataHandler(BaseDataHandler):
     """Handles reading and writing local data files."""
 
-    def read(self, file_path: str, extension: str = None) -> pd.DataFrame:
+    _READERS = {
+        'json': _read_json,
+        'csv': _read_csv,
+        'parquet': _read_parquet,
+        'feather': _read_feather
+    }
+
+    _BATCH_READERS = {
+        'json': _iter_read_json,
+        'csv': _iter_read_csv,
+        'parquet': _iter_read_parquet,
+        'feather': _iter_read_feather
+    }
+
+    _WRITERS = {
+        'json': _write_json,
+        'csv': _write_csv,
+        'parquet': _write_parquet_frame,
+        'feather': _write_feather
+    }
+
+    def read(self, file_path: str, extension: str = None, columns: List[str] = None) -> pd.DataFrame:
         """
         Reads data from a local file.
 
+        Parquet and Feather files are memory-mapped, so only the pages of the requested columns are read.
+
         Args:
             file_path (str): The path of the file to read.
             extension (str): The file extension (if not in the file name).
+            columns (List[str]): The columns to read. Defaults to all columns.
 
         Returns:
             pd.DataFrame: The DataFrame containing the read data.
         """
-        readers = {
-            'json': lambda path: pd.DataFrame(json.load(open(path, 'r'))),
-            'csv': pd.read_csv,
-            'parquet': pd.read_parquet
-        }
-
-        file_extension = extension or file_path.split('.')[-1]
+        file_extension = (extension or _file_extension(file_path)).lower()
 
-        reader_func = readers.get(file_extension)
+        reader_func = self._READERS.get(file_extension)
         if reader_func:
             try:
-                return reader_func(file_path)
+                return reader_func(file_path, columns)
             except Exception as e:
                 raise IOError(f"Error reading file at {file_path}: {e}")
         else:
             raise ValueError(f"Unsupported file extension: {file_extension}")
 
-    def _generate_file_name(self, base_name: str, extension: str, output_dir: str) -> str:
+    def read_many(
+        self, file_paths: List[str], extension: str = None, columns: List[str] = None, max_workers: int = None
+    ) -> pd.DataFrame:
+        """
+        Reads multiple local files concurrently and concatenates them.
+
+        Args:
+            file_paths (List[str]): The paths of the files to read.
+            extension (str): The file extension (if not in the file names).
+            columns (List[str]): The columns to read. Defaults to all columns.
+            max_workers (int): The number of reader threads. Defaults to the CPU count.
+
+        Returns:
+            pd.DataFrame: The DataFrame containing the rows of all files, in the given order.
+        """
+        if not file_paths:
+            raise ValueError("No file paths given to read")
+
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            frames = list(executor.map(lambda path: self.read(path, extension, columns), file_paths))
+        return pd.concat(frames, ignore_index=True)
+
+    def iter_read(self, file_path: str, batch_size: int = 100_000, extension: str = None) -> Iterator[pd.DataFrame]:
+        """
+        Reads data from a local file in batches without loading the whole file into memory.
+
+        Args:
+            file_path (str): The path of the file to read.
+            batch_size (int): The maximum number of rows per batch.
+            extension (str): The file extension (if not in the file name).
+                JSON files are expected to be in JSON Lines format.
+
+        Yields:
+            pd.DataFrame: A DataFrame containing the next batch of rows.
+        """
+        file_extension = (extension or _file_extension(file_path)).lower()
+
+        reader_func = self._BATCH_READERS.get(file_extension)
+        if not reader_func:
+            raise ValueError(f"Unsupported file extension for batched reading: {file_extension}")
+
+        try:
+            yield from reader_func(file_path, batch_size)
+        except Exception as e:
+            raise IOError(f"Error reading file at {file_path}: {e}")
+
+    def _generate_file_name(
+        self, base_name: str, extension: str, output_dir: str, timestamp: str = None, shard: int = None
+    ) -> str:
         """
         Generates a file name with a timestamp.
 
@@ -57,14 +554,25 @@ class LocalDataHandler(BaseDataHandler):
             base_name (str): The base name of the file.
             extension (str): The file extension.
             output_dir (str): The directory where the file will be saved.
+            timestamp (str): A precomputed timestamp to share across a batch. Defaults to the current time.
+            shard (int): The shard number, appended to keep files written in the same second apart.
 
         Returns:
             str: The generated file name.
         """
-        date_str = datetime.datetime.now().strftime("%d-%m-%Y_%H-%M-%S")
-        return os.path.join(output_dir, f"{base_name}_{date_str}.{extension}")
-
-    def write(self, df: pd.DataFrame, base_name: str, output_dir: str, extension: str) -> None:
+        timestamp = timestamp or _current_timestamp()
+        shard_suffix = f"_{shard:05d}" if shard is not None else ""
+        return f"{output_dir}{os.sep}{base_name}_{timestamp}{shard_suffix}.{extension}"
+
+    def write(
+        self,
+        df: pd.DataFrame,
+        base_name: str,
+        output_dir: str,
+        extension: str = 'parquet',
+        shard: int = None,
+        timestamp: str = None
+    ) -> None:
         """
         Writes data to a local file.
 
@@ -72,82 +580,287 @@ class LocalDataHandler(BaseDataHandler):
             df (pd.DataFrame): The DataFrame to write.
             base_name (str): The base name of the file.
             output_dir (str): The directory where the file will be saved.
-            extension (str): The file extension.
+            extension (str): The file extension. Defaults to 'parquet'.
+            shard (int): The shard number, for writers producing several files per batch.
+            timestamp (str): A timestamp shared by every shard of a batch. Defaults to the current time.
 
         Returns:
             None
         """
+        extension = extension.lower()
         os.makedirs(output_dir, exist_ok=True)
-        file_path = self._generate_file_name(base_name, extension, output_dir)
-
-        writers = {
-            'json': lambda path: df.to_json(path),
-            'csv': lambda path: df.to_csv(path, index=False),
-            'parquet': lambda path: df.to_parquet(path, index=False)
-        }
+        file_path = self._generate_file_name(base_name, extension, output_dir, timestamp=timestamp, shard=shard)
 
-        writer_func = writers.get(extension)
+        writer_func = self._WRITERS.get(extension)
         if writer_func:
             try:
-                writer_func(file_path)
+                writer_func(df, file_path)
                 print(f"Data written to {file_path}")
             except Exception as e:
                 raise IOError(f"Error writing file to {file_path}: {e}")
         else:
             raise ValueError(f"Unsupported file extension: {extension}")
+
+    def write_batches(
+        self,
+        batches: Iterable[pd.DataFrame],
+        base_name: str,
+        output_dir: str,
+        shard: int = None,
+        timestamp: str = None
+    ) -> None:
+        """
+        Streams DataFrame batches into a single local Parquet file.
+
+        Each batch is compressed and flushed as it arrives, so the full data never has to be held in memory.
+
+        Args:
+            batches (Iterable[pd.DataFrame]): The DataFrames to write, sharing the same columns.
+            base_name (str): The base name of the file.
+            output_dir (str): The directory where the file will be saved.
+            shard (int): The shard number, for writers producing several files per batch.
+            timestamp (str): A timestamp shared by every shard of a batch. Defaults to the current time.
+
+        Returns:
+            None
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        file_path = self._generate_file_name(base_name, 'parquet', output_dir, timestamp=timestamp, shard=shard)
+
+        try:
+            if _write_parquet(batches, file_path):
+                print(f"Data written to {file_path}")
+            else:
+                print(f"No batches to write, skipped {file_path}")
+        except Exception as e:
+            raise IOError(f"Error writing file to {file_path}: {e}")
+
+_UNQUOTED_IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_$]*$')
+
+def _fold_identifier(name: str) -> str:
+    """
+    Lower-cases names that could be written bare, matching how PostgreSQL folds unquoted names.
+
+    Keeps tables and columns created before identifiers were quoted matching.
+
+    Args:
+        name (str): The identifier.
+
+    Returns:
+        str: The identifier as PostgreSQL stores it.
+    """
+    name = str(name)
+    return name.lower() if _UNQUOTED_IDENTIFIER.match(name) else name
+
+def _identifier(name: str) -> sql.Identifier:
+    """
+    Builds a quoted PostgreSQL column identifier.
+
+    Args:
+        name (str): The column name.
+
+    Returns:
+        sql.Identifier: The identifier, safe to embed in a SQL statement.
+    """
+    return sql.Identifier(_fold_identifier(name))
+
+def _table_identifier(table_name: str) -> sql.Identifier:
+    """
+    Builds a quoted, possibly schema-qualified table identifier such as 'public.events'.
+
+    Args:
+        table_name (str): The table name.
+
+    Returns:
+        sql.Identifier: The table identifier, safe to embed in a SQL statement.
+    """
+    return sql.Identifier(*(_fold_identifier(part) for part in table_name.split('.')))
+
+def _null_marker(data: pd.DataFrame) -> str:
+    """
+    Returns a COPY NULL marker that does not occur as a value in the DataFrame's text columns.
+
+    Args:
+        data (pd.DataFrame): The DataFrame that will be loaded.
+
+    Returns:
+        str: The NULL marker, '\\N' unless that string is present in the data.
+    """
+    text_columns = [
+        column for column, dtype in data.dtypes.items()
+        if dtype == object or pd.api.types.is_string_dtype(dtype)
+    ]
+    marker = '\\N'
+    while any(data[column].isin([marker]).any() for column in text_columns):
+        marker += '\\N'
+    return marker
+
+# PostgreSQL type OIDs (as reported in cursor.description) mapped to Pandas dtypes. Columns are
+# Arrow-backed, like the frames returned by LocalDataHandler. NUMERIC has no fixed precision when
+# created by write(), so it is kept as Python Decimal objects.
+_POSTGRES_OID_DTYPES = {
+    16: pd.ArrowDtype(pa.bool_()),
+    20: pd.ArrowDtype(pa.int64()),
+    21: pd.ArrowDtype(pa.int16()),
+    23: pd.ArrowDtype(pa.int32()),
+    700: pd.ArrowDtype(pa.float32()),
+    701: pd.ArrowDtype(pa.float64()),
+    1700: object,
+    25: pd.ArrowDtype(pa.string()),
+    1042: pd.ArrowDtype(pa.string()),
+    1043: pd.ArrowDtype(pa.string()),
+    2950: pd.ArrowDtype(pa.string()),
+    1082: pd.ArrowDtype(pa.date32()),
+    1114: pd.ArrowDtype(pa.timestamp('us')),
+    1184: pd.ArrowDtype(pa.timestamp('us', tz='UTC')),
+    1186: pd.ArrowDtype(pa.duration('us'))
+}
+
+def _typed_array(values: tuple, dtype) -> pd.api.extensions.ExtensionArray:
+    """
+    Builds a Pandas array with the given dtype, inferring the dtype if the values do not fit it.
+
+    Args:
+        values (tuple): The values of one column.
+        dtype: The Pandas dtype to use, or None to infer it.
+
+    Returns:
+        pd.api.extensions.ExtensionArray: The column values.
+    """
+    if dtype is not None:
+        try:
+            return pd.array(values, dtype=dtype)
+        except (ValueError, TypeError, OverflowError):
+            pass
+    return pd.array(values)
         
 class PostgresDataHandler(BaseDataHandler):
     """Handles reading and writing data to a PostgreSQL database."""
 
-    def _init_(self):
+    def __init__(self):
         self.postgres = PostgreSQLDB()
         self.engine, self.session = self.postgres.connect()
 
-    def _get_postgres_type(self, series: pd.Series) -> str:
+    def _get_postgres_type(self, dtype) -> str:
         """
-        Maps a Pandas Series dtype to a PostgreSQL data type.
+        Maps a Pandas dtype to a PostgreSQL data type.
 
         Args:
-            series (pd.Series): The Pandas Series to map.
+            dtype: The Pandas or NumPy dtype to map.
 
         Returns:
             str: The PostgreSQL data type.
         """
-        type_mapping = {
-            'object': 'TEXT',
-            'int64': 'BIGINT',
-            'int32': 'INT',
-            'float64': 'DOUBLE PRECISION',
-            'float32': 'FLOAT',
-            'datetime64[ns]': 'TIMESTAMP'
-        }
-
-        series_dtype = str(series.dtype)
-        return type_mapping.get(series_dtype, 'TEXT')
+        if isinstance(dtype, pd.ArrowDtype):
+            return self._get_postgres_type_from_arrow(dtype.pyarrow_dtype)
+
+        kind = dtype.kind
+        if kind == 'b':
+            return 'BOOLEAN'
+        if kind == 'i':
+            return {1: 'SMALLINT', 2: 'SMALLINT', 4: 'INT'}.get(dtype.itemsize, 'BIGINT')
+        if kind == 'u':
+            return {1: 'SMALLINT', 2: 'INT', 4: 'BIGINT'}.get(dtype.itemsize, 'NUMERIC')
+        if kind == 'f':
+            return 'DOUBLE PRECISION' if dtype.itemsize == 8 else 'REAL'
+        if kind == 'M':
+            return 'TIMESTAMP WITH TIME ZONE' if getattr(dtype, 'tz', None) else 'TIMESTAMP'
+        if kind == 'm':
+            return 'INTERVAL'
+        return 'TEXT'
+
+    def _get_postgres_type_from_arrow(self, arrow_type: pa.DataType) -> str:
+        """
+        Maps a PyArrow data type to a PostgreSQL data type.
 
+        Args:
+            arrow_type (pa.DataType): The PyArrow data type to map.
 
-    def _create_table(self, table_name: str, columns_info: str) -> None:
+        Returns:
+            str: The PostgreSQL data type.
+        """
+        if pa.types.is_boolean(arrow_type):
+            return 'BOOLEAN'
+        if pa.types.is_int8(arrow_type) or pa.types.is_int16(arrow_type) or pa.types.is_uint8(arrow_type):
+            return 'SMALLINT'
+        if pa.types.is_int32(arrow_type) or pa.types.is_uint16(arrow_type):
+            return 'INT'
+        if pa.types.is_uint64(arrow_type):
+            return 'NUMERIC'
+        if pa.types.is_integer(arrow_type):
+            return 'BIGINT'
+        if pa.types.is_float16(arrow_type) or pa.types.is_float32(arrow_type):
+            return 'REAL'
+        if pa.types.is_floating(arrow_type):
+            return 'DOUBLE PRECISION'
+        if pa.types.is_decimal(arrow_type):
+            return 'NUMERIC'
+        if pa.types.is_timestamp(arrow_type):
+            return 'TIMESTAMP WITH TIME ZONE' if arrow_type.tz else 'TIMESTAMP'
+        if pa.types.is_date(arrow_type):
+            return 'DATE'
+        if pa.types.is_duration(arrow_type):
+            return 'INTERVAL'
+        return 'TEXT'
+
+    def _create_table(self, cursor, table_name: str, column_types: dict) -> None:
         """
         Creates a PostgreSQL table if it does not exist.
 
         Args:
+            cursor: The DBAPI cursor of the current transaction.
             table_name (str): The name of the table.
-            columns_info (str): The columns and their data types.
+            column_types (dict): The column names mapped to their PostgreSQL data types.
 
         Returns:
             None
         """
-        create_table_query = f"CREATE TABLE IF NOT EXISTS {table_name} ({columns_info})"
+        columns_info = sql.SQL(', ').join(
+            sql.SQL("{} {}").format(_identifier(column), sql.SQL(column_type))
+            for column, column_type in column_types.items()
+        )
+        create_table_query = sql.SQL("CREATE TABLE IF NOT EXISTS {} ({})").format(
+            _table_identifier(table_name), columns_info
+        )
+
         try:
-            self.postgres.execute_query(text(create_table_query))
+            cursor.execute(create_table_query)
             print(f"Table created successfully: {table_name}")
         except Exception as e:
             raise RuntimeError(f"Failed to create table {table_name}: {e}")
 
+    def _copy_from_dataframe(self, cursor, data: pd.DataFrame, table_name: str, chunksize: int = 100_000) -> None:
+        """
+        Bulk loads a DataFrame into a PostgreSQL table using COPY FROM STDIN.
+
+        Args:
+            cursor: The DBAPI cursor of the current transaction.
+            data (pd.DataFrame): The DataFrame to load.
+            table_name (str): The name of the PostgreSQL table.
+            chunksize (int): The number of rows serialized per COPY buffer.
+
+        Returns:
+            None
+        """
+        null_marker = _null_marker(data)
+        copy_query = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT CSV, NULL {})").format(
+            _table_identifier(table_name),
+            sql.SQL(', ').join(_identifier(column) for column in data.columns),
+            sql.Literal(null_marker)
+        )
+
+        for start in range(0, len(data), chunksize):
+            buffer = io.StringIO()
+            data.iloc[start:start + chunksize].to_csv(buffer, index=False, header=False, na_rep=null_marker)
+            buffer.seek(0)
+            cursor.copy_expert(copy_query, buffer)
+
     def write(self, data: pd.DataFrame, table_name: str) -> None:
         """
         Writes data to a PostgreSQL table.
 
+        The table creation and the data load run in a single transaction on one connection.
+
         Args:
             data (pd.DataFrame): The DataFrame to write.
             table_name (str): The name of the PostgreSQL table.
@@ -156,31 +869,58 @@ class PostgresDataHandler(BaseDataHandler):
             None
         """
         try:
-            column_types = {column: self._get_postgres_type(data[column]) for column in data.columns}
-            columns_info = ', '.join([f"{col} {col_type}" for col, col_type in column_types.items()])
-            self._create_table(table_name, columns_info)
-            data.to_sql(table_name, con=self.engine, if_exists='append', index=False)
+            column_types = {column: self._get_postgres_type(dtype) for column, dtype in data.dtypes.items()}
+            with self.engine.begin() as connection:
+                with connection.connection.cursor() as cursor:
+                    self._create_table(cursor, table_name, column_types)
+                    self._copy_from_dataframe(cursor, data, table_name)
             print(f"Successfully written DataFrame to PostgreSQL table: {table_name}")
         except Exception as e:
             raise RuntimeError(f"Failed to write DataFrame to PostgreSQL table {table_name}: {e}")
-        finally:
-            self.postgres.disconnect()
 
-    def read(self, table_name: str) -> pd.DataFrame:
+    def _rows_to_dataframe(self, rows: list, columns: List[str], dtypes: list) -> pd.DataFrame:
+        """
+        Builds a DataFrame from result rows column by column.
+
+        Args:
+            rows (list): The result rows.
+            columns (List[str]): The column names.
+            dtypes (list): The Pandas dtype of each column, or None to infer it.
+
+        Returns:
+            pd.DataFrame: The DataFrame containing the rows.
+        """
+        values = list(zip(*rows)) if rows else [()] * len(columns)
+        return pd.DataFrame({
+            column: _typed_array(column_values, dtype)
+            for column, column_values, dtype in zip(columns, values, dtypes)
+        })
+
+    def read(self, table_name: str, chunksize: int = 100_000) -> pd.DataFrame:
         """
         Reads data from a PostgreSQL table.
 
+        Rows are streamed from a server-side cursor in chunks instead of being buffered client-side,
+        and columns get Arrow-backed dtypes from their PostgreSQL types, matching LocalDataHandler.
+
         Args:
             table_name (str): The name of the table to read.
+            chunksize (int): The number of rows fetched per round-trip.
 
         Returns:
             pd.DataFrame: The DataFrame containing the read data.
         """
         try:
-            query = f"SELECT * FROM {table_name}"
-            result = self.postgres.execute_query(query)
-            data = result.fetchall()
-            columns = result.keys()
-            return pd.DataFrame(data, columns=columns)
+            with self.engine.connect().execution_options(stream_results=True) as connection:
+                query = sql.SQL("SELECT * FROM {}").format(_table_identifier(table_name))
+                result = connection.exec_driver_sql(query.as_string(connection.connection.dbapi_connection))
+                columns = list(result.keys())
+                dtypes = [_POSTGRES_OID_DTYPES.get(description[1]) for description in result.cursor.description]
+                chunks = [
+                    self._rows_to_dataframe(rows, columns, dtypes) for rows in result.partitions(chunksize)
+                ]
+            if not chunks:
+                return self._rows_to_dataframe([], columns, dtypes)
+            return pd.concat(chunks, ignore_index=True)
         except Exception as e:
             raise RuntimeError(f"Failed to read data from PostgreSQL table {table_name}: {e}")
\ No newline at end of file
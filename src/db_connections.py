@@ -4,17 +4,40 @@ from sqlalchemy.engine.base import Engine
 from sqlalchemy.orm.session import Session
 from dotenv import load_dotenv
 from minio import Minio
+import functools
 import os
 from abc import ABC, abstractmethod
 
 # Load the .env file
 load_dotenv()
 
+@functools.lru_cache(maxsize=None)
+def _get_engine(url: str) -> Engine:
+    """
+    Returns a process-wide SQLAlchemy Engine for the given URL, creating it on first use.
+
+    Args:
+        url (str): The database URL.
+
+    Returns:
+        Engine: The shared SQLAlchemy Engine with its connection pool.
+    """
+    return create_engine(
+        url,
+        executemany_mode='values_plus_batch',
+        insertmanyvalues_page_size=10000,
+        executemany_batch_page_size=1000,
+        pool_size=8,
+        max_overflow=16,
+        pool_pre_ping=True,
+        pool_recycle=1800
+    )
+
 class BaseDBConnection(ABC):
     """
     Abstract base class for database connections.
     """
-    def _init_(self):
+    def __init__(self):
         pass
 
     @abstractmethod
@@ -28,7 +51,7 @@ class PostgreSQLDB(BaseDBConnection):
     """
     Class for PostgreSQL database connection.
     """
-    def _init_(self):
+    def __init__(self):
         """
         Initializes PostgreSQLDB object and fetches connection details from environment variables.
         """
@@ -51,7 +74,7 @@ class PostgreSQLDB(BaseDBConnection):
             Session: SQLAlchemy Session object representing the database session.
         """
         try:
-            self.engine = create_engine(f'postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.db}')
+            self.engine = _get_engine(f'postgresql+psycopg2://{self.user}:{self.password}@{self.host}:{self.port}/{self.db}')
             self.Session = sessionMaker(bind=self.engine)
             print("Successfully connected to: ", self.engine.url)
         except Exception as e:
@@ -61,6 +84,8 @@ class PostgreSQLDB(BaseDBConnection):
     def disconnect(self):
         """
         Disconnects from the PostgreSQL database.
+
+        Closes every pooled connection of the shared engine, so it should only be called at shutdown.
         """
         try:
             if self.engine:
@@ -94,7 +119,7 @@ class MinioClient(BaseDBConnection):
     """
     Class for MinIO client connection.
     """
-    def _init_(self):
+    def __init__(self):
         """
         Initializes MinioClient object and fetches connection details from environment variables.
         """
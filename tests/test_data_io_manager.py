@@ -0,0 +1,336 @@
+import datetime
+import decimal
+import hashlib
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from src.data_io_manager import (
+    LocalDataHandler,
+    PostgresDataHandler,
+    _PARQUET_SCHEMA_LOOKAHEAD,
+    _POSTGRES_OID_DTYPES,
+    _null_marker,
+    _identifier,
+    _table_identifier,
+)
+
+
+def test_null_marker_defaults_to_backslash_n():
+    df = pd.DataFrame({'name': ['a', 'b'], 'value': [1, None]})
+    assert _null_marker(df) == '\\N'
+
+
+def test_null_marker_avoids_values_present_in_text_columns():
+    df = pd.DataFrame({'name': ['\\N', '\\N\\N', None], 'value': [1, 2, 3]})
+    marker = _null_marker(df)
+    assert marker not in {'\\N', '\\N\\N'}
+    assert not df['name'].isin([marker]).any()
+
+
+@pytest.mark.parametrize('extension', ['csv', 'json', 'parquet', 'feather'])
+def test_iter_read_matches_read_dtypes(tmp_path, extension):
+    df = pd.DataFrame({
+        'id': range(10),
+        'name': [f"row{i}" for i in range(10)],
+        'created_at': pd.date_range('2024-01-01', periods=10, freq='h'),
+    })
+    handler = LocalDataHandler()
+    handler.write(df, 'data', str(tmp_path), extension=extension)
+    path = str(next(tmp_path.glob(f"*.{extension}")))
+
+    batches = list(handler.iter_read(path, batch_size=4))
+
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    combined = pd.concat(batches, ignore_index=True)
+    pd.testing.assert_frame_equal(combined, handler.read(path))
+
+
+def test_iter_read_csv_keeps_one_type_per_column(tmp_path):
+    csv_path = tmp_path / "input.csv"
+    csv_path.write_text("v\n1\n2\nthree\n4\n")
+    handler = LocalDataHandler()
+
+    batches = list(handler.iter_read(str(csv_path), batch_size=2))
+
+    assert {str(batch['v'].dtype) for batch in batches} == {str(handler.read(str(csv_path))['v'].dtype)}
+    handler.write_batches(iter(batches), 'data', str(tmp_path / "out"))
+
+
+def test_read_json_lines(tmp_path):
+    df = pd.DataFrame({'id': [1, 2, 3], 'name': ['a', 'b', 'c']})
+    handler = LocalDataHandler()
+    handler.write(df, 'data', str(tmp_path), extension='json')
+    path = str(next(tmp_path.glob("*.json")))
+
+    result = handler.read(path)
+
+    assert result['id'].tolist() == [1, 2, 3]
+    assert result['name'].tolist() == ['a', 'b', 'c']
+
+
+def test_read_json_lines_with_nested_values(tmp_path):
+    df = pd.DataFrame({'id': [1, 2], 'tags': [['a', 'b'], ['c']], 'meta': [{'k': 1}, {'k': 2}]})
+    handler = LocalDataHandler()
+    handler.write(df, 'data', str(tmp_path), extension='json')
+
+    result = handler.read(str(next(tmp_path.glob("*.json"))))
+
+    assert result['id'].tolist() == [1, 2]
+    assert [list(tags) for tags in result['tags']] == [['a', 'b'], ['c']]
+    assert [meta['k'] for meta in result['meta']] == [1, 2]
+
+
+def test_read_json_pretty_printed_document(tmp_path):
+    path = tmp_path / "records.json"
+    path.write_text('[\n  {"id": 1, "name": "a"},\n  {"id": 2, "name": "b"}\n]\n')
+
+    result = LocalDataHandler().read(str(path))
+
+    assert result['id'].tolist() == [1, 2]
+
+
+def test_read_json_single_object(tmp_path):
+    df = pd.DataFrame({'id': [1, 2, 3], 'name': ['a', 'b', 'c']})
+    path = str(tmp_path / "legacy.json")
+    df.to_json(path)
+
+    result = LocalDataHandler().read(path)
+
+    assert len(result) == 3
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in result.dtypes)
+    assert result['id'].tolist() == [1, 2, 3]
+    assert result['name'].tolist() == ['a', 'b', 'c']
+
+
+def test_identifier_folds_plain_names_to_lower_case():
+    assert _identifier('UserID').strings == ('userid',)
+    assert _identifier('video_id').strings == ('video_id',)
+
+
+def test_identifier_keeps_names_that_need_quoting():
+    assert _identifier('#').strings == ('#',)
+    assert _identifier('Has Space').strings == ('Has Space',)
+
+
+def test_table_identifier_keeps_schema_separate():
+    assert _table_identifier('Public.Events').strings == ('public', 'events')
+    assert _table_identifier('public.my table').strings == ('public', 'my table')
+
+
+def test_read_many_concatenates_in_order(tmp_path):
+    handler = LocalDataHandler()
+    paths = []
+    for shard in range(3):
+        output_dir = tmp_path / str(shard)
+        handler.write(pd.DataFrame({'id': [shard * 2, shard * 2 + 1]}), 'data', str(output_dir))
+        paths.append(str(next(output_dir.glob("*.parquet"))))
+
+    result = handler.read_many(paths)
+
+    assert result['id'].tolist() == [0, 1, 2, 3, 4, 5]
+
+
+def test_read_many_rejects_empty_input():
+    with pytest.raises(ValueError, match="No file paths"):
+        LocalDataHandler().read_many([])
+
+
+def test_write_shards_share_the_given_timestamp(tmp_path):
+    handler = LocalDataHandler()
+    for shard in range(2):
+        handler.write(pd.DataFrame({'id': [shard]}), 'data', str(tmp_path), shard=shard, timestamp='01-01-2024_00-00-00')
+
+    names = sorted(path.name for path in tmp_path.iterdir())
+
+    assert names == ['data_01-01-2024_00-00-00_00000.parquet', 'data_01-01-2024_00-00-00_00001.parquet']
+
+
+def test_write_batches_unifies_all_null_first_batch(tmp_path):
+    batches = [
+        pd.DataFrame({'id': [1, 2], 'score': [None, None]}),
+        pd.DataFrame({'id': [3, 4], 'score': [1.5, None]}),
+        pd.DataFrame({'id': [5, 6], 'score': [2.5, 3.5]}),
+    ]
+    handler = LocalDataHandler()
+    handler.write_batches(batches, 'data', str(tmp_path))
+
+    result = handler.read(str(next(tmp_path.glob("*.parquet"))))
+
+    assert result['id'].tolist() == [1, 2, 3, 4, 5, 6]
+    assert result['score'].isna().tolist() == [True, True, False, True, False, False]
+    assert result['score'].dropna().tolist() == [1.5, 2.5, 3.5]
+
+
+def test_write_batches_from_iter_read(tmp_path):
+    csv_path = tmp_path / "input.csv"
+    csv_path.write_text("id,score\n1,\n2,\n3,4\n4,5\n")
+    handler = LocalDataHandler()
+    output_dir = tmp_path / "out"
+
+    handler.write_batches(handler.iter_read(str(csv_path), batch_size=2), 'data', str(output_dir))
+
+    result = handler.read(str(next(output_dir.glob("*.parquet"))))
+    assert result['id'].tolist() == [1, 2, 3, 4]
+    assert result['score'].tolist()[2:] == [4, 5]
+
+
+def test_write_batches_names_the_incompatible_column(tmp_path):
+    batches = [pd.DataFrame({'id': [1, 2]}), pd.DataFrame({'id': ['a', 'b']})]
+
+    with pytest.raises(IOError, match="Column 'id'"):
+        LocalDataHandler().write_batches(batches, 'data', str(tmp_path))
+
+
+def test_write_batches_without_batches_writes_nothing(tmp_path, capsys):
+    LocalDataHandler().write_batches(iter([]), 'data', str(tmp_path))
+
+    assert list(tmp_path.iterdir()) == []
+    assert "Data written" not in capsys.readouterr().out
+
+
+def _sample_frame():
+    return pd.DataFrame({
+        'id': [1, 2, 3, 4],
+        'name': ['a', 'b', None, 'd'],
+        'score': [1.5, None, 2.5, 3.5],
+    })
+
+
+@pytest.mark.parametrize('extension', ['csv', 'json', 'parquet', 'feather'])
+def test_local_round_trip(tmp_path, extension):
+    df = _sample_frame()
+    handler = LocalDataHandler()
+    handler.write(df, 'data', str(tmp_path), extension=extension)
+    path = str(next(tmp_path.glob(f"*.{extension}")))
+
+    result = handler.read(path)
+
+    assert list(result.columns) == ['id', 'name', 'score']
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in result.dtypes)
+    assert result['id'].tolist() == [1, 2, 3, 4]
+    assert result['name'].isna().tolist() == [False, False, True, False]
+    assert result['score'].dropna().tolist() == [1.5, 2.5, 3.5]
+
+
+def test_write_defaults_to_parquet(tmp_path):
+    LocalDataHandler().write(_sample_frame(), 'data', str(tmp_path))
+
+    assert [path.suffix for path in tmp_path.iterdir()] == ['.parquet']
+
+
+@pytest.mark.parametrize('extension', ['csv', 'json', 'parquet', 'feather'])
+def test_read_projects_columns(tmp_path, extension):
+    handler = LocalDataHandler()
+    handler.write(_sample_frame(), 'data', str(tmp_path), extension=extension)
+    path = str(next(tmp_path.glob(f"*.{extension}")))
+
+    result = handler.read(path, columns=['id', 'score'])
+
+    assert list(result.columns) == ['id', 'score']
+
+
+def test_parquet_compression_is_chosen_per_column(tmp_path):
+    df = pd.DataFrame({
+        'category': ['x'] * 1000,
+        'noise': [i * 0.123456789 for i in range(1000)],
+        'label': [f"item-{i % 200}" for i in range(1000)],
+    })
+    LocalDataHandler().write(df, 'data', str(tmp_path))
+    path = str(next(tmp_path.glob("*.parquet")))
+
+    row_group = pq.ParquetFile(path).metadata.row_group(0)
+    codecs = {row_group.column(i).path_in_schema: row_group.column(i).compression for i in range(row_group.num_columns)}
+
+    assert codecs == {'category': 'UNCOMPRESSED', 'noise': 'UNCOMPRESSED', 'label': 'ZSTD'}
+
+
+def _rows_to_dataframe(rows, columns, oids):
+    handler = PostgresDataHandler.__new__(PostgresDataHandler)
+    return handler._rows_to_dataframe(rows, columns, [_POSTGRES_OID_DTYPES.get(oid) for oid in oids])
+
+
+def test_rows_to_dataframe_keeps_sentinel_timestamps():
+    rows = [(1, datetime.datetime(9999, 12, 31)), (2, None)]
+
+    result = _rows_to_dataframe(rows, ['id', 'valid_to'], [20, 1114])
+
+    assert str(result['id'].dtype) == 'int64[pyarrow]'
+    assert result['valid_to'].iloc[0] == pd.Timestamp('9999-12-31')
+    assert pd.isna(result['valid_to'].iloc[1])
+
+
+def test_rows_to_dataframe_types_timestamptz_columns():
+    tz = datetime.timezone(datetime.timedelta(hours=3))
+    rows = [(datetime.datetime(2024, 1, 1, 12, tzinfo=tz),)]
+
+    result = _rows_to_dataframe(rows, ['created_at'], [1184])
+
+    assert str(result['created_at'].dtype) == 'timestamp[us, tz=UTC][pyarrow]'
+    assert result['created_at'].iloc[0] == pd.Timestamp('2024-01-01 09:00', tz='UTC')
+
+
+def test_rows_to_dataframe_falls_back_to_inferred_dtype():
+    rows = [('not-a-number',)]
+
+    result = _rows_to_dataframe(rows, ['value'], [20])
+
+    assert result['value'].tolist() == ['not-a-number']
+
+
+def test_write_batches_opens_writer_within_lookahead(tmp_path):
+    consumed_before_open = []
+
+    def batches():
+        for i in range(50):
+            if not list(tmp_path.glob("*.parquet")):
+                consumed_before_open.append(i)
+            yield pd.DataFrame({'id': [i], 'empty': [None]})
+
+    handler = LocalDataHandler()
+    handler.write_batches(batches(), 'data', str(tmp_path))
+
+    assert len(consumed_before_open) <= _PARQUET_SCHEMA_LOOKAHEAD
+    result = handler.read(str(next(tmp_path.glob("*.parquet"))))
+    assert result['id'].tolist() == list(range(50))
+    assert result['empty'].isna().all()
+
+
+def test_parquet_compresses_columns_whose_dictionary_would_overflow(tmp_path):
+    values = [hashlib.sha256(str(i % 12_000).encode()).hexdigest() * 2 for i in range(131_072)]
+    df = pd.DataFrame({'value': values})
+    LocalDataHandler().write(df, 'data', str(tmp_path))
+    path = next(tmp_path.glob("*.parquet"))
+
+    baseline = tmp_path / "zstd.parquet"
+    pq.write_table(
+        pa.Table.from_pandas(df, preserve_index=False), str(baseline),
+        compression='zstd', compression_level=3, use_dictionary=True, data_page_version='2.0'
+    )
+
+    assert path.stat().st_size <= baseline.stat().st_size
+
+
+def test_extensions_are_case_insensitive(tmp_path):
+    handler = LocalDataHandler()
+    handler.write(_sample_frame(), 'data', str(tmp_path), extension='PARQUET')
+    path = next(tmp_path.glob("*.parquet"))
+    upper_path = path.with_suffix('.PARQUET')
+    path.rename(upper_path)
+
+    assert handler.read(str(upper_path))['id'].tolist() == [1, 2, 3, 4]
+    assert handler.read(str(upper_path), extension='Parquet')['id'].tolist() == [1, 2, 3, 4]
+
+
+def test_rows_to_dataframe_types_columns_created_by_write():
+    rows = [(datetime.date(2024, 1, 2), datetime.timedelta(hours=1), decimal.Decimal('1.50'), 'ab  ',
+             '6f1c1f4e-7c1a-4b8e-9a57-1f0d5c0b2e11')]
+
+    result = _rows_to_dataframe(rows, ['day', 'duration', 'amount', 'code', 'uuid'], [1082, 1186, 1700, 1042, 2950])
+
+    assert [str(dtype) for dtype in result.dtypes] == [
+        'date32[day][pyarrow]', 'duration[us][pyarrow]', 'object', 'string[pyarrow]', 'string[pyarrow]'
+    ]
+    assert result['amount'].iloc[0] == decimal.Decimal('1.50')
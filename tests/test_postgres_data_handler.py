@@ -0,0 +1,108 @@
+import pandas as pd
+import pytest
+from psycopg2 import sql
+
+from src.data_io_manager import PostgresDataHandler
+
+
+def _render(query):
+    if isinstance(query, sql.Composed):
+        return ''.join(_render(part) for part in query.seq)
+    if isinstance(query, sql.SQL):
+        return query.string
+    if isinstance(query, sql.Identifier):
+        return '.'.join('"' + part.replace('"', '""') + '"' for part in query.strings)
+    if isinstance(query, sql.Literal):
+        return "'" + str(query.wrapped).replace("'", "''") + "'"
+    raise TypeError(f"Unexpected query part: {query!r}")
+
+
+class RecordingCursor:
+    def __init__(self, events, fail_on_copy=False):
+        self.events = events
+        self.fail_on_copy = fail_on_copy
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, query):
+        self.events.append(('execute', _render(query)))
+
+    def copy_expert(self, query, buffer):
+        if self.fail_on_copy:
+            raise RuntimeError("COPY failed")
+        self.events.append(('copy', _render(query), buffer.read()))
+
+
+class RecordingEngine:
+    def __init__(self, fail_on_copy=False):
+        self.events = []
+        self.fail_on_copy = fail_on_copy
+
+    def begin(self):
+        engine = self
+
+        class Transaction:
+            class connection:
+                @staticmethod
+                def cursor():
+                    return RecordingCursor(engine.events, engine.fail_on_copy)
+
+            def __enter__(self):
+                engine.events.append(('begin',))
+                return self
+
+            def __exit__(self, exc_type, exc, traceback):
+                engine.events.append(('rollback',) if exc_type else ('commit',))
+                return False
+
+        return Transaction()
+
+
+def _handler(engine):
+    handler = PostgresDataHandler.__new__(PostgresDataHandler)
+    handler.engine = engine
+    return handler
+
+
+def test_write_creates_table_and_copies_in_one_transaction(monkeypatch):
+    copy = PostgresDataHandler._copy_from_dataframe
+    monkeypatch.setattr(
+        PostgresDataHandler, '_copy_from_dataframe',
+        lambda self, cursor, data, table_name: copy(self, cursor, data, table_name, chunksize=2)
+    )
+    engine = RecordingEngine()
+    df = pd.DataFrame({'ID': [1, 2, 3, 4, 5], 'name': ['a', None, 'c', 'd', 'e']})
+
+    _handler(engine).write(df, 'public.Events')
+
+    kinds = [event[0] for event in engine.events]
+    assert kinds == ['begin', 'execute', 'copy', 'copy', 'copy', 'commit']
+    assert engine.events[1][1] == 'CREATE TABLE IF NOT EXISTS "public"."events" ("id" BIGINT, "name" TEXT)'
+    copies = [event for event in engine.events if event[0] == 'copy']
+    assert {event[1] for event in copies} == {
+        'COPY "public"."events" ("id", "name") FROM STDIN WITH (FORMAT CSV, NULL \'\\N\')'
+    }
+    assert [event[2] for event in copies] == ['1,a\n2,\\N\n', '3,c\n4,d\n', '5,e\n']
+
+
+def test_write_uses_default_chunk_size():
+    engine = RecordingEngine()
+    df = pd.DataFrame({'id': range(250_001)})
+
+    _handler(engine).write(df, 'events')
+
+    assert sum(1 for event in engine.events if event[0] == 'copy') == 3
+
+
+def test_write_does_not_commit_when_copy_fails():
+    engine = RecordingEngine(fail_on_copy=True)
+
+    with pytest.raises(RuntimeError, match="COPY failed"):
+        _handler(engine).write(pd.DataFrame({'id': [1]}), 'events')
+
+    assert engine.events[-1] == ('rollback',)
+    assert ('commit',) not in engine.events